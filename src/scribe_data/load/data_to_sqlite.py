@@ -34,6 +34,7 @@ import json
 import os
 import sqlite3
 import sys
+from multiprocessing import Pool
 
 from tqdm.auto import tqdm
 
@@ -100,231 +101,290 @@ language_word_type_dict = {
     for lang in languages_update
 }
 
-print(
-    f"Creating SQLite databases for the following languages: {', '.join(languages_update)}"
-)
-for lang in tqdm(
-    language_word_type_dict,
-    desc="Databases created",
-    unit="dbs",
-):
-    if language_word_type_dict[lang] != []:
-        maybe_over = ""  # output string formatting variable (see below)
-        if os.path.exists(
-            f"databases/{get_language_iso(lang).upper()}LanguageData.sqlite"
-        ):
-            os.remove(f"databases/{get_language_iso(lang).upper()}LanguageData.sqlite")
-            maybe_over = "over"
 
-        connection = sqlite3.connect(
-            f"databases/{get_language_iso(lang).upper()}LanguageData.sqlite"
-        )
-        cursor = connection.cursor()
+def _noun_table(json_data, lang):
+    """
+    Returns the columns and rows for a language's nouns table.
+    """
+    cols = ["noun, plural, form"]
+    rows = [
+        [row, json_data[row]["plural"], json_data[row]["form"]] for row in json_data
+    ]
 
-        def create_table(word_type, cols):
-            """
-            Creates a table in the language database given a word type for its title and column names.
+    if "Scribe" not in json_data and lang != "Russian":
+        rows.append(["Scribe", "Scribes", ""])
+    # elif "Писец" not in json_data and lang == "Russian":
+    #     rows.append(["Писец", "Писцы", ""])
 
-            Parameters
-            ----------
-                word_type : str
-                    The name of the table to be created
+    return cols, rows
 
-                cols : list of strings
-                    The names of columns for the new table
-            """
-            cursor.execute(
-                f"CREATE TABLE IF NOT EXISTS {word_type} ({' Text, '.join(cols)} Text, UNIQUE({cols[0]}))"
-            )
 
-        def table_insert(word_type, keys):
-            """
-            Inserts a row into a language database table.
+def _verb_table(json_data, lang):
+    """
+    Returns the columns and rows for a language's verbs table.
+    """
+    cols = ["verb"]
+    cols += json_data[list(json_data.keys())[0]].keys()
+    rows = [
+        [row] + [json_data[row][col_name] for col_name in cols[1:]] for row in json_data
+    ]
 
-            Parameters
-            ----------
-                word_type : str
-                    The name of the table to be inserted into
+    return cols, rows
+
+
+def _preposition_table(json_data, lang):
+    """
+    Returns the columns and rows for a language's prepositions table.
+    """
+    return ["preposition, form"], [[row, json_data[row]] for row in json_data]
+
+
+def _translation_table(json_data, lang):
+    """
+    Returns the columns and rows for a language's translations table.
+    """
+    return ["word, translation"], [[row, json_data[row]] for row in json_data]
+
+
+def _autosuggestion_table(json_data, lang):
+    """
+    Returns the columns and rows for a language's autosuggestions table.
+    """
+    cols = ["word", "suggestion_0", "suggestion_1", "suggestion_2"]
+    rows = []
+    for row in json_data:
+        keys = [row]
+        keys += [json_data[row][i] for i in range(len(json_data[row]))]
+        keys += [""] * (len(cols) - len(keys))
+        rows.append(keys)
+
+    return cols, rows
+
+
+def _emoji_keyword_table(json_data, lang):
+    """
+    Returns the columns and rows for a language's emoji keywords table.
+    """
+    cols = ["word", "emoji_0", "emoji_1", "emoji_2"]
+    rows = []
+    for row in json_data:
+        keys = [row]
+        keys += [json_data[row][i]["emoji"] for i in range(len(json_data[row]))]
+        keys += [""] * (len(cols) - len(keys))
+        rows.append(keys)
+
+    return cols, rows
+
+
+# Resolve each word type to its table builder once so table creation is a
+# single dict lookup rather than a chain of type checks.
+table_builders = {
+    "nouns": _noun_table,
+    "verbs": _verb_table,
+    "prepositions": _preposition_table,
+    "translations": _translation_table,
+    "autosuggestions": _autosuggestion_table,
+    "emoji_keywords": _emoji_keyword_table,
+}
 
-                keys : list of strings
-                    The values to be inserted into the table row
-            """
-            insert_question_marks = ", ".join(["?"] * len(keys))
-            cursor.execute(
-                f"INSERT OR IGNORE INTO {word_type} values({insert_question_marks})",
-                keys,
-            )
 
-        print(f"Database for {lang} {maybe_over}written and connection made.")
-        for wt in language_word_type_dict[lang]:
-            print(f"Creating {lang} {wt} table...")
-            json_data = json.load(
-                open(
-                    f"{os.path.dirname(sys.path[0]).split('scribe_data')[0]}/../language_data_export/{lang}/{wt}.json"
-                )
-            )
+def create_language_db(lang_and_word_types):
+    """
+    Creates the SQLite database for a single language from its exported JSON data.
 
-            if wt == "nouns":
-                cols = ["noun, plural, form"]
-                create_table(word_type=wt, cols=cols)
-                for row in json_data:
-                    keys = [row, json_data[row]["plural"], json_data[row]["form"]]
-                    table_insert(word_type=wt, keys=keys)
-
-                if "Scribe" not in json_data and lang != "Russian":
-                    table_insert(word_type=wt, keys=["Scribe", "Scribes", ""])
-                # elif "Писец" not in json_data and lang == "Russian":
-                #     table_insert(word_type=wt, keys=["Писец", "Писцы", ""])
-
-                connection.commit()
-
-            elif wt == "verbs":
-                cols = ["verb"]
-                cols += json_data[list(json_data.keys())[0]].keys()
-                create_table(word_type=wt, cols=cols)
-                for row in json_data:
-                    keys = [row]
-                    keys += [json_data[row][col_name] for col_name in cols[1:]]
-                    table_insert(word_type=wt, keys=keys)
-
-                connection.commit()
-
-            elif wt == "prepositions":
-                cols = ["preposition, form"]
-                create_table(word_type=wt, cols=cols)
-                for row in json_data:
-                    keys = [row, json_data[row]]
-                    table_insert(word_type=wt, keys=keys)
-
-                connection.commit()
-
-            elif wt == "translations":
-                cols = ["word, translation"]
-                create_table(word_type=wt, cols=cols)
-                for row in json_data:
-                    keys = [row, json_data[row]]
-                    table_insert(word_type=wt, keys=keys)
-
-                connection.commit()
-
-            elif wt == "autosuggestions":
-                cols = ["word", "suggestion_0", "suggestion_1", "suggestion_2"]
-                create_table(word_type=wt, cols=cols)
-                for row in json_data:
-                    keys = [row]
-                    keys += [json_data[row][i] for i in range(len(json_data[row]))]
-                    keys += [""] * (len(cols) - len(keys))
-                    table_insert(word_type=wt, keys=keys)
-
-                connection.commit()
-
-            elif wt == "emoji_keywords":
-                cols = ["word", "emoji_0", "emoji_1", "emoji_2"]
-                create_table(word_type=wt, cols=cols)
-                for row in json_data:
-                    keys = [row]
-                    keys += [
-                        json_data[row][i]["emoji"] for i in range(len(json_data[row]))
-                    ]
-                    keys += [""] * (len(cols) - len(keys))
-                    table_insert(word_type=wt, keys=keys)
-
-                connection.commit()
-
-        wt = "autocomplete_lexicon"
-        print(f"Creating {lang} {wt} table...")
-        cols = ["word"]
-        create_table(word_type=wt, cols=cols)
+    Parameters
+    ----------
+        lang_and_word_types : tuple
+            The language and the list of word types it has data for, passed as
+            a tuple for pool.imap_unordered.
+    """
+    lang, lang_word_types = lang_and_word_types
 
+    if lang_word_types == []:
+        print(f"Skipping {lang} database creation as no JSON data files were found.")
+        return
+
+    maybe_over = ""  # output string formatting variable (see below)
+    if os.path.exists(f"databases/{get_language_iso(lang).upper()}LanguageData.sqlite"):
+        os.remove(f"databases/{get_language_iso(lang).upper()}LanguageData.sqlite")
+        maybe_over = "over"
+
+    connection = sqlite3.connect(
+        f"databases/{get_language_iso(lang).upper()}LanguageData.sqlite"
+    )
+    cursor = connection.cursor()
+
+    # Speed up the bulk load; the databases are rebuilt from scratch if a write fails.
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+
+    def create_table(word_type, cols):
+        """
+        Creates a table in the language database given a word type for its title and column names.
+
+        Parameters
+        ----------
+            word_type : str
+                The name of the table to be created
+
+            cols : list of strings
+                The names of columns for the new table
+        """
         cursor.execute(
-            """
-            INSERT INTO autocomplete_lexicon (word)
-
-            WITH full_lexicon AS (
-                SELECT
-                noun AS word
-                FROM
-                nouns
-                WHERE
-                LENGTH(noun) > 2
-
-                UNION
-
-                SELECT
-                preposition AS word
-                FROM
-                prepositions
-                WHERE
-                LENGTH(preposition) > 2
-
-                UNION
-
-                SELECT DISTINCT
-                -- For autosuggestion keys we want lower case versions.
-                -- The SELECT DISTINCT cases later will make sure that nouns are appropriately selected.
-                LOWER(word) AS word
-                FROM
-                autosuggestions
-                WHERE
-                LENGTH(word) > 2
-
-                UNION
-
-                SELECT
-                word AS word
-                FROM
-                emoji_keywords
+            f"CREATE TABLE IF NOT EXISTS {word_type} ({' Text, '.join(cols)} Text, UNIQUE({cols[0]}))"
+        )
+
+    def table_insert(word_type, rows):
+        """
+        Inserts a batch of rows into a language database table.
+
+        All rows are sent through a single executemany call so that SQLite
+        commits once per table rather than once per inserted row.
+
+        Parameters
+        ----------
+            word_type : str
+                The name of the table to be inserted into
+
+            rows : list of lists of strings
+                The values to be inserted into the table rows
+        """
+        if not rows:
+            return
+
+        insert_question_marks = ", ".join(["?"] * len(rows[0]))
+        cursor.executemany(
+            f"INSERT OR IGNORE INTO {word_type} values({insert_question_marks})",
+            rows,
+        )
+
+    print(f"Database for {lang} {maybe_over}written and connection made.")
+    for wt in lang_word_types:
+        print(f"Creating {lang} {wt} table...")
+        json_data = json.load(
+            open(
+                f"{os.path.dirname(sys.path[0]).split('scribe_data')[0]}/../language_data_export/{lang}/{wt}.json"
             )
+        )
 
-            SELECT DISTINCT
-                -- Select an upper case noun if it's available.
-                CASE
-                    WHEN
-                        UPPER(SUBSTR(lex.word, 1, 1)) || SUBSTR(lex.word, 2) = nouns_cap.noun
-                    THEN
-                        nouns_cap.noun
-
-                    WHEN
-                        UPPER(lex.word) = nouns_upper.noun
-                    THEN
-                        nouns_upper.noun
-
-                    ELSE
-                        lex.word
-                END
+        cols, rows = table_builders[wt](json_data, lang)
+        create_table(word_type=wt, cols=cols)
+        table_insert(word_type=wt, rows=rows)
+        connection.commit()
 
-            FROM
-                full_lexicon AS lex
+    wt = "autocomplete_lexicon"
+    print(f"Creating {lang} {wt} table...")
+    cols = ["word"]
+    create_table(word_type=wt, cols=cols)
 
-            LEFT JOIN
-                nouns AS nouns_cap
+    cursor.execute(
+        """
+        INSERT INTO autocomplete_lexicon (word)
+
+        WITH full_lexicon AS (
+            SELECT
+            noun AS word
+            FROM
+            nouns
+            WHERE
+            LENGTH(noun) > 2
 
-            ON
-                UPPER(SUBSTR(lex.word, 1, 1)) || SUBSTR(lex.word, 2) = nouns_cap.noun
+            UNION
 
-            LEFT JOIN
-                nouns AS nouns_upper
+            SELECT
+            preposition AS word
+            FROM
+            prepositions
+            WHERE
+            LENGTH(preposition) > 2
 
-            ON
-                UPPER(lex.word) = nouns_upper.noun
+            UNION
 
+            SELECT DISTINCT
+            -- For autosuggestion keys we want lower case versions.
+            -- The SELECT DISTINCT cases later will make sure that nouns are appropriately selected.
+            LOWER(word) AS word
+            FROM
+            autosuggestions
             WHERE
-                LENGTH(lex.word) > 1
-                AND lex.word NOT LIKE '%-%'
-                AND lex.word NOT LIKE '%/%'
-                AND lex.word NOT LIKE '%(%'
-                AND lex.word NOT LIKE '%)%'
-                AND lex.word NOT LIKE '%"%'
-                AND lex.word NOT LIKE '%“%'
-                AND lex.word NOT LIKE '%„%'
-                AND lex.word NOT LIKE '%”%'
-                AND lex.word NOT LIKE "%'%"
-            """
+            LENGTH(word) > 2
+
+            UNION
+
+            SELECT
+            word AS word
+            FROM
+            emoji_keywords
         )
 
-        connection.commit()
+        SELECT DISTINCT
+            -- Select an upper case noun if it's available.
+            CASE
+                WHEN
+                    UPPER(SUBSTR(lex.word, 1, 1)) || SUBSTR(lex.word, 2) = nouns_cap.noun
+                THEN
+                    nouns_cap.noun
 
-        print(f"{lang} database created.")
+                WHEN
+                    UPPER(lex.word) = nouns_upper.noun
+                THEN
+                    nouns_upper.noun
 
-    else:
-        print(f"Skipping {lang} database creation as no JSON data files were found.")
+                ELSE
+                    lex.word
+            END
+
+        FROM
+            full_lexicon AS lex
+
+        LEFT JOIN
+            nouns AS nouns_cap
+
+        ON
+            UPPER(SUBSTR(lex.word, 1, 1)) || SUBSTR(lex.word, 2) = nouns_cap.noun
+
+        LEFT JOIN
+            nouns AS nouns_upper
+
+        ON
+            UPPER(lex.word) = nouns_upper.noun
+
+        WHERE
+            LENGTH(lex.word) > 1
+            AND lex.word NOT LIKE '%-%'
+            AND lex.word NOT LIKE '%/%'
+            AND lex.word NOT LIKE '%(%'
+            AND lex.word NOT LIKE '%)%'
+            AND lex.word NOT LIKE '%"%'
+            AND lex.word NOT LIKE '%“%'
+            AND lex.word NOT LIKE '%„%'
+            AND lex.word NOT LIKE '%”%'
+            AND lex.word NOT LIKE "%'%"
+        """
+    )
+
+    connection.commit()
+    # Close explicitly so the WAL is checkpointed into the database file and
+    # its -wal/-shm sidecars are removed before the database is shipped.
+    connection.close()
+
+    print(f"{lang} database created.")
+
+
+print(
+    f"Creating SQLite databases for the following languages: {', '.join(languages_update)}"
+)
+
+# Note: Each language database is independent, so they can be created in parallel.
+if __name__ == "__main__":
+    with Pool(processes=os.cpu_count()) as pool:
+        for _ in tqdm(
+            pool.imap_unordered(
+                create_language_db, list(language_word_type_dict.items())
+            ),
+            total=len(language_word_type_dict),
+            desc="Databases created",
+            unit="dbs",
+        ):
+            pass
@@ -86,13 +86,17 @@ def translate_to_other_languages(source_language, word_list, translations, batch
         lambda sig, frame: translation_interrupt_handler(source_language, translations),
     )
 
+    target_langcodes = get_target_langcodes(source_language)
+    tokenizer.src_lang = get_language_iso(source_language)
+
     for i in range(0, len(word_list), batch_size):
         batch_words = word_list[i : i + batch_size]
         print(f"Translating batch {i//batch_size + 1}: {batch_words}")
 
-        for lang_code in get_target_langcodes(source_language):
-            tokenizer.src_lang = get_language_iso(source_language)
-            encoded_words = tokenizer(batch_words, return_tensors="pt", padding=True)
+        # Encode the batch once as the encoding depends only on the source language.
+        encoded_words = tokenizer(batch_words, return_tensors="pt", padding=True)
+
+        for lang_code in target_langcodes:
             generated_tokens = model.generate(
                 **encoded_words, forced_bos_token_id=tokenizer.get_lang_id(lang_code)
             )
@@ -101,10 +105,7 @@ def translate_to_other_languages(source_language, word_list, translations, batch
             )
 
             for word, translation in zip(batch_words, translated_words):
-                if word not in translations:
-                    translations[word] = {}
-
-                translations[word][lang_code] = translation
+                translations.setdefault(word, {})[lang_code] = translation
 
         print(f"Batch {i//batch_size + 1} translation completed.")
 
@@ -24,6 +24,7 @@ import ast
 import json
 import os
 import sys
+from functools import lru_cache
 from importlib import resources
 from typing import Any
 
@@ -67,6 +68,11 @@ _languages = _load_json(
 )
 
 
+# Cached source-to-target value maps built by _find so that lookups are a
+# single dict access rather than a scan of _languages per call.
+_find_maps: dict[tuple[str, str], dict] = {}
+
+
 def _find(source_key: str, source_value: str, target_key: str, error_msg: str):
     """
     Each 'language', (english, german,..., etc) is a dictionary of key/value pairs:
@@ -105,13 +111,18 @@ def _find(source_key: str, source_value: str, target_key: str, error_msg: str):
     """
     norm_source_value = source_value.lower()
 
-    if target_value := [
-        entry[target_key]
-        for entry in _languages
-        if entry[source_key] == norm_source_value
-    ]:
-        assert len(target_value) == 1, f"More than one entry for '{norm_source_value}'"
-        return target_value[0]
+    if (source_key, target_key) not in _find_maps:
+        lookup_map = {}
+        for entry in _languages:
+            assert (
+                entry[source_key] not in lookup_map
+            ), f"More than one entry for '{entry[source_key]}'"
+            lookup_map[entry[source_key]] = entry[target_key]
+
+        _find_maps[(source_key, target_key)] = lookup_map
+
+    if norm_source_value in _find_maps[(source_key, target_key)]:
+        return _find_maps[(source_key, target_key)][norm_source_value]
 
     raise ValueError(error_msg)
 
@@ -235,6 +246,33 @@ def get_language_words_to_ignore(language: str) -> list[str]:
     )
 
 
+@lru_cache(maxsize=32)
+def _load_json_data(path, mtime_ns, size):
+    """
+    Loads a JSON data file, caching the parsed result by path, modification time and size.
+
+    Repeated loads of an unchanged file within a process are answered from the
+    cache, while any rewrite of the file changes the key and forces a re-parse.
+
+    Parameters
+    ----------
+        path : str
+            The path to the JSON file to be loaded.
+
+        mtime_ns : int
+            The modification time of the file in nanoseconds.
+
+        size : int
+            The size of the file in bytes.
+
+    Returns
+    -------
+        The parsed contents of the JSON file.
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
 def load_queried_data(file_path, language, data_type):
     """
     Loads queried data from a JSON file for a specific language and data type.
@@ -265,8 +303,15 @@ def load_queried_data(file_path, language, data_type):
         LANG_DIR_PATH = f"{PATH_TO_SCRIBE_ORG}/Scribe-Data/src/scribe_data/language_data_extraction/{language}"
         data_path = f"{LANG_DIR_PATH}/{data_type}/{queried_data_file}"
 
-    with open(data_path, encoding="utf-8") as f:
-        return json.load(f), update_data_in_use, data_path
+    data_file_stats = os.stat(data_path)
+
+    return (
+        _load_json_data(
+            data_path, data_file_stats.st_mtime_ns, data_file_stats.st_size
+        ),
+        update_data_in_use,
+        data_path,
+    )
 
 
 def export_formatted_data(formatted_data, update_data_in_use, language, data_type):
@@ -295,7 +340,8 @@ def export_formatted_data(formatted_data, update_data_in_use, language, data_typ
     else:
         export_path = f"{data_type}.json"
 
-    with open(export_path, "w", encoding="utf-8") as file:
+    # A 1 MB buffer as json.dump writes the data in many small chunks.
+    with open(export_path, "w", encoding="utf-8", buffering=1 << 20) as file:
         json.dump(formatted_data, file, ensure_ascii=False, indent=0)
 
     print(f"Wrote file {data_type}.json with {len(formatted_data):,} {data_type}.")
@@ -98,31 +98,22 @@ for lang in languages_update:
     if len(set(check_current_data)) == 1 and check_current_data[0] == 0:
         new_language_list.append(lang)
 
-# Derive queries to be ran.
-possible_queries = []
-for d in language_directories:
-    possible_queries.extend(
-        f"{PATH_TO_LANGUAGE_EXTRACTION_FILES}/{d}/{target_type}"
-        for target_type in word_types_update
-        if f"{PATH_TO_LANGUAGE_EXTRACTION_FILES}/{d}/{target_type}"
-        in [
-            e[: len(f"{PATH_TO_LANGUAGE_EXTRACTION_FILES}/{d}/{target_type}")]
-            for e in language_data_extraction_files
-        ]
-    )
-
-queries_to_run_lists = [
-    [
-        q
-        for q in possible_queries
-        if q.split(PATH_TO_LANGUAGE_EXTRACTION_FILES + "/")[1].split("/")[0]
-        in languages_update
-    ]
-    for lang in languages_update
+# Derive queries to be ran given the directories that have files in them.
+dirs_with_files = set()
+for file_path in language_data_extraction_files:
+    file_dir = os.path.dirname(file_path)
+    while len(file_dir) > len(PATH_TO_LANGUAGE_EXTRACTION_FILES):
+        dirs_with_files.add(file_dir)
+        file_dir = os.path.dirname(file_dir)
+
+queries_to_run = [
+    f"{PATH_TO_LANGUAGE_EXTRACTION_FILES}/{d}/{target_type}"
+    for d in language_directories
+    if d in languages_update
+    for target_type in word_types_update
+    if f"{PATH_TO_LANGUAGE_EXTRACTION_FILES}/{d}/{target_type}" in dirs_with_files
 ]
 
-queries_to_run = list({q for sub in queries_to_run_lists for q in sub})
-
 # Run queries and format data.
 data_added_dict = {}
 for q in tqdm(
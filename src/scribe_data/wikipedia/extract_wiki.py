@@ -20,18 +20,18 @@ Module for downloading and creating workable files from Wikipedia dumps.
     -->
 """
 
+import bz2
 import gc
-import json
 import os
+import shutil
 import subprocess
 import time
 import xml.sax
-from itertools import chain
 from multiprocessing import Pool
-from multiprocessing.dummy import Pool as Threadpool
 
 import defusedxml.sax
 import mwparserfromhell
+import orjson
 import requests
 from bs4 import BeautifulSoup
 from tqdm.auto import tqdm
@@ -142,6 +142,38 @@ def download_wiki(language="en", target_dir="wiki_dump", file_limit=None, dump_i
     return file_info
 
 
+def _open_dump_file(input_path):
+    """
+    Opens a bz2 compressed Wikipedia dump file as a binary stream of decompressed bytes.
+
+    lbzip2 and pbzip2 decompress bz2 blocks in parallel across all cores, so they're
+    preferred over the single-threaded bzcat and the bz2 module when installed.
+
+    Parameters
+    ----------
+        input_path : str
+            The path to the compressed dump file.
+
+    Returns
+    -------
+        A file object yielding the decompressed bytes of the dump.
+    """
+    for decompressor in ("lbzip2", "pbzip2"):
+        if shutil.which(decompressor):
+            return subprocess.Popen(
+                [decompressor, "-dc", input_path],
+                stdout=subprocess.PIPE,
+                bufsize=1 << 20,
+            ).stdout
+
+    if shutil.which("bzcat"):
+        return subprocess.Popen(
+            ["bzcat", input_path], stdout=subprocess.PIPE, bufsize=1 << 20
+        ).stdout
+
+    return bz2.open(input_path, "rb")
+
+
 def _process_article(title, text):
     """
     Process a wikipedia article to extract the title and text.
@@ -207,67 +239,65 @@ def iterate_and_parse_file(args):
     output_path = f"{partitions_dir}/{file_name}"
 
     if not os.path.exists(output_path):
-        if article_limit is None:
-            pbar = tqdm(
-                total=len(
-                    [
-                        i
-                        for i, line in enumerate(
-                            subprocess.Popen(
-                                ["bzcat"],
-                                stdin=open(input_path, encoding="utf-8"),
-                                stdout=subprocess.PIPE,
-                            ).stdout
-                        )
-                    ]
-                ),
-                desc="Lines read",
-                unit="lines",
-                disable=not verbose,
-            )
-            for line in subprocess.Popen(
-                ["bzcat"],
-                stdin=open(input_path, encoding="utf-8"),
-                stdout=subprocess.PIPE,
-            ).stdout:
-                try:
-                    parser.feed(line)
-                except StopIteration:
-                    break
-
-                pbar.update()
-
-        else:
-            pbar = tqdm(
-                total=article_limit,
-                desc="Articles found",
-                unit="article",
-                disable=not verbose,
-            )
-            articles_found = 0
-            for line in subprocess.Popen(
-                ["bzcat"],
-                stdin=open(input_path, encoding="utf-8"),
-                stdout=subprocess.PIPE,
-            ).stdout:
-                try:
-                    parser.feed(line)
-                except StopIteration:
-                    break
+        # Stream articles to disk as they're parsed so memory use is bounded
+        # by a single article rather than the whole partition. Write to a
+        # temporary name and rename once the parse finishes so an interrupted
+        # run can't leave a truncated partition that later looks complete.
+        tmp_output_path = f"{output_path}.tmp"
+        with open(tmp_output_path, "wb", buffering=1 << 20) as f_out:
+            handler.output_file = f_out
+
+            if article_limit is None:
+                # Track progress by decompressed bytes so the dump isn't fully
+                # decompressed once beforehand just to count its lines.
+                pbar = tqdm(
+                    desc="Data read",
+                    unit="B",
+                    unit_scale=True,
+                    mininterval=1.0,
+                    smoothing=0,
+                    disable=not verbose,
+                )
+                # Feed the parser fixed-size blocks rather than Python-level
+                # lines; element boundaries don't matter to SAX and this
+                # avoids a read call and bytes object per dump line.
+                dump_file = _open_dump_file(input_path)
+                while block := dump_file.read(1 << 20):
+                    try:
+                        parser.feed(block)
+                    except StopIteration:
+                        break
+
+                    pbar.update(len(block))
+
+                pbar.close()
+
+            else:
+                pbar = tqdm(
+                    total=article_limit,
+                    desc="Articles found",
+                    unit="article",
+                    mininterval=1.0,
+                    disable=not verbose,
+                )
+                articles_found = 0
+                for line in _open_dump_file(input_path):
+                    try:
+                        parser.feed(line)
+                    except StopIteration:
+                        break
 
-                if len(handler.target_articles) == articles_found + 1:
-                    articles_found += 1
-                    pbar.update()
+                    if handler.articles_found == articles_found + 1:
+                        articles_found += 1
+                        pbar.update()
 
-                if len(handler.target_articles) >= article_limit:
-                    break
+                    if handler.articles_found >= article_limit:
+                        break
 
-        with open(output_path, "w", encoding="utf-8") as f_out:
-            for ta in handler.target_articles:
-                f_out.write(json.dumps(ta) + "\n")
+        os.replace(tmp_output_path, output_path)
 
         if verbose:
-            n_art = len(handler.target_articles)
+            n_art = handler.articles_found
             print(
                 f"File {file_name} with {n_art} articles processed and saved in {partitions_dir}"
             )
@@ -371,33 +401,18 @@ def parse_to_ndjson(
                 ):
                     pass
 
-        def read_and_combine_json(file_path):
-            """
-            Read in json data from a file_path.
-            """
-            data = []
-
-            with open(file_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    data.append(json.loads(line))
-
-            return data
-
-        threadpool = Threadpool(processes=num_cores)
         partition_files = [
             f"{partitions_dir}/{f}"
             for f in os.listdir(partitions_dir)
             if f[-len(".ndjson") :] == ".ndjson"
         ]
 
-        if __name__ == "scribe_data.wikipedia.extract_wiki":
-            results = threadpool.map(read_and_combine_json, partition_files)
-
-        file_list = list(chain(*results))
-
-        with open(output_file_name, "wt", encoding="utf-8") as f_out:
-            for f in file_list:
-                f_out.write(json.dumps(f) + "\n")
+        # The partitions are already ndjson, so their bytes can be concatenated
+        # directly rather than parsed and re-serialized article by article.
+        with open(output_file_name, "wb", buffering=1 << 20) as f_out:
+            for partition_file in partition_files:
+                with open(partition_file, "rb") as f_in:
+                    shutil.copyfileobj(f_in, f_out, 1 << 20)
         print(f"File {output_file_name} with Wikipedia articles saved")
 
     else:
@@ -421,6 +436,10 @@ class WikiXmlHandler(xml.sax.handler.ContentHandler):
         self._values = {}
         self._current_tag = None
         self.target_articles = []
+        self.articles_found = 0
+        # When set, completed articles are written here as ndjson lines
+        # instead of being accumulated in target_articles.
+        self.output_file = None
 
     def characters(self, content):
         """
@@ -445,9 +464,17 @@ class WikiXmlHandler(xml.sax.handler.ContentHandler):
             self._values[name] = " ".join(self._buffer)
 
         if name == "page":
+            # Check the raw title first so archive files and drafts are
+            # rejected with a substring scan before the wikitext parse.
+            title = self._values["title"]
+            if "Wikipedia:" in title or "Draft:" in title:
+                return
+
             target_article = _process_article(**self._values)
-            if target_article and (
-                "Wikipedia:" not in target_article[0]
-                and "Draft:" not in target_article[0]
-            ):  # no archive files or drafts
-                self.target_articles.append(target_article)
+            if target_article:
+                if self.output_file is not None:
+                    self.output_file.write(orjson.dumps(target_article) + b"\n")
+                else:
+                    self.target_articles.append(target_article)
+
+                self.articles_found += 1
@@ -27,6 +27,7 @@ import sys
 import warnings
 from collections import Counter
 from itertools import chain
+from multiprocessing import Pool
 from urllib.error import HTTPError
 
 import numpy as np
@@ -49,6 +50,221 @@ sparql.setReturnFormat(JSON)
 sparql.setMethod(POST)
 
 
+# Precompiled patterns and tables used by _clean_worker on every article.
+_website_regex = re.compile(r"(?<!\S)http\S+")
+_markup_regexes = [
+    re.compile(r"\([^)]*\)"),
+    re.compile(r"\[.*?\]"),
+    re.compile(r"<[^>]+>"),
+    re.compile(r"===[^>]+==="),
+    re.compile(r"==[^>]+=="),
+    re.compile(r"{{[^>]+}}"),
+    re.compile(r"{[^>]+}"),
+]
+_multiple_spaces_regex = re.compile(r" {2,}")
+
+_symbols_to_remove = [
+    "!",
+    "@",
+    "#",
+    "$",
+    "%",
+    "^",
+    "&",
+    "*",
+    "–",
+    # "-", we do hyphenated words later
+    "_",
+    "+",
+    "=",
+    "`",
+    "~",
+    "|",
+    "\\",
+    ";",
+    ":",
+    '"',
+    "„",
+    "“",
+    "?",
+    "/",
+    ",",
+    ".",
+    "·",
+    "«",
+    "»",
+    "(",
+    ")",
+    "[",
+    "]",
+    "{",
+    "}",
+    "\n",
+]
+
+_wikipedia_namespaces = [
+    # English
+    "Talk:",
+    "User:",
+    "Wikipedia:",
+    "File:",
+    "MediaWiki:",
+    "Template:",
+    "Help:",
+    "Category:",
+    "Portal:",
+    "Draft:",
+    "Topic:",
+    # French
+    "Discussion:",
+    "Utilisateur:",
+    "Catégorie:",
+    "Aide:",
+    "Portail:",
+    # German
+    "Diskussion:",
+    "Benutzer:",
+    "Kategorie:",
+    "Hilfe:",
+    # Italian
+    "Discussioni:",
+    "Discussione:",
+    "Utente:",
+    "Aiuto:",
+    "Categoria:",
+    "Portale:",
+    # Portuguese
+    "Wikipédia:",
+    "Discussão:",
+    "Usuário(a):",
+    "Ficheiro:",
+    "Predefinição:",
+    "Ajuda:",
+    "Tópico:",
+    # Russian
+    "Обсуждение:",
+    "Участник:",
+    "Википедия:",
+    "Категория:",
+    "Портал:",
+    # Spanish
+    "Discusión:",
+    "Usuario:",
+    "Archivo:",
+    "Plantilla:",
+    "Ayuda:",
+    "Categoría:",
+    # Swedish
+    "Diskussion:",
+    "Användare:",
+    "Kategori",
+    "Fil:",
+    "Mall:",
+    "Hjälp:",
+]
+
+# Match all namespaces at once so each article is scanned a single time
+# rather than once per namespace, and delete symbols in one translate pass.
+_namespace_regex = re.compile("|".join(map(re.escape, _wikipedia_namespaces)))
+_symbol_delete_table = {ord(s): None for s in _symbols_to_remove}
+
+
+class _DigitDeleteTable(dict):
+    """
+    Translation table for str.translate that deletes any character for which str.isdigit is true.
+    """
+
+    def __missing__(self, codepoint):
+        self[codepoint] = None if chr(codepoint).isdigit() else codepoint
+        return self[codepoint]
+
+
+_digit_delete_table = _DigitDeleteTable()
+
+
+single_letter_words_dict = {
+    "french": ["a", "à", "y"],
+    "german": ["à"],
+    "italian": ["a", "e", "è", "i", "o"],
+    "portuguese": ["a", "e", "é", "o"],
+    "russian": ["а", "б", "в", "ж", "и", "к", "о", "с", "у", "я"],
+    "spanish": ["a", "e", "o", "u", "y"],
+    "swedish": ["à", "å", "i", "ö"],
+}
+
+
+def _init_clean_worker(language, words_to_remove):
+    """
+    Initializes per-process state for _clean_worker so it's set up once per worker rather than once per article.
+
+    Parameters
+    ----------
+        language : str
+            The language of the texts being cleaned.
+
+        words_to_remove : list
+            Strings that should be removed from the text bodies.
+    """
+    global _worker_language
+    global _worker_words_to_remove
+
+    _worker_language = language
+    # A frozenset as the worker only does membership checks, once per token.
+    _worker_words_to_remove = frozenset(words_to_remove)
+
+
+def _clean_worker(t):
+    """
+    Cleans and tokenizes a single article text (see clean for the full process).
+
+    Parameters
+    ----------
+        t : str
+            The text to be cleaned and tokenized.
+
+    Returns
+    -------
+        The tokenized words of the cleaned article, or None if nothing remains of it.
+    """
+    language = _worker_language
+    words_to_remove = _worker_words_to_remove
+
+    # Remove all websites and new line markers.
+    t = _website_regex.sub("", t)
+
+    # Remove all text between parentheses, brackets, braces and multiple equal signs.
+    for markup_regex in _markup_regexes:
+        t = markup_regex.sub("", t)
+
+    # Remove numbers and symbols.
+    t = t.translate(_digit_delete_table)
+
+    # Remove namespaces before symbols as ":" is in the symbols.
+    t = _namespace_regex.sub("", t)
+    t = t.translate(_symbol_delete_table)
+
+    if language == "russian":
+        # Remove Latin characters that aren't in Cyrillic.
+        t = regex.sub(r"[+/p{Latin}]", "", t)
+
+    # Remove all spaces that are larger than one in length.
+    t = _multiple_spaces_regex.sub(" ", t)
+
+    if t in ["", " "]:
+        return None
+
+    return [
+        w
+        for w in t.split()
+        if (len(w) != 1 or w in single_letter_words_dict[language])
+        and w not in words_to_remove
+        and "nbsp" not in w
+        and "-" not in w
+        and "Wikipedia" not in w
+        and w != "-"
+    ]
+
+
 def clean(
     texts,
     language="English",
@@ -158,171 +374,24 @@ def clean(
         texts = [texts[i] for i in selected_idxs]
         print("Random sampling finished.")
 
+    # Clean articles in worker processes so that the regex passes run on all cores.
     cleaned_texts = []
-    for t in tqdm(texts, desc="Articles cleaned", unit="articles", disable=not verbose):
-        # Remove all websites and new line markers.
-        websites = [word for word in t.split() if word[:4] == "http"]
-        for w in websites:
-            t = t.replace(w, "")
-
-        # Remove all text between parentheses, brackets, braces and multiple equal signs.
-        t = re.sub(r"\([^)]*\)", "", t)
-        t = re.sub(r"\[.*?\]", "", t)
-        t = re.sub(r"<[^>]+>", "", t)
-        t = re.sub(r"===[^>]+===", "", t)
-        t = re.sub(r"==[^>]+==", "", t)
-        t = re.sub(r"{{[^>]+}}", "", t)
-        t = re.sub(r"{[^>]+}", "", t)
-
-        # Remove numbers and symbols.
-        t = "".join(c for c in t if not c.isdigit())
-
-        symbols_to_remove = [
-            "!",
-            "@",
-            "#",
-            "$",
-            "%",
-            "^",
-            "&",
-            "*",
-            "–",
-            # "-", we do hyphenated words later
-            "_",
-            "+",
-            "=",
-            "`",
-            "~",
-            "|",
-            "\\",
-            ";",
-            ":",
-            '"',
-            "„",
-            "“",
-            "?",
-            "/",
-            ",",
-            ".",
-            "·",
-            "«",
-            "»",
-            "(",
-            ")",
-            "[",
-            "]",
-            "{",
-            "}",
-            "\n",
-        ]
-
-        wikipedia_namespaces = [
-            # English
-            "Talk:",
-            "User:",
-            "Wikipedia:",
-            "File:",
-            "MediaWiki:",
-            "Template:",
-            "Help:",
-            "Category:",
-            "Portal:",
-            "Draft:",
-            "Topic:",
-            # French
-            "Discussion:",
-            "Utilisateur:",
-            "Catégorie:",
-            "Aide:",
-            "Portail:",
-            # German
-            "Diskussion:",
-            "Benutzer:",
-            "Kategorie:",
-            "Hilfe:",
-            # Italian
-            "Discussioni:",
-            "Discussione:",
-            "Utente:",
-            "Aiuto:",
-            "Categoria:",
-            "Portale:",
-            # Portuguese
-            "Wikipédia:",
-            "Discussão:",
-            "Usuário(a):",
-            "Ficheiro:",
-            "Predefinição:",
-            "Ajuda:",
-            "Tópico:",
-            # Russian
-            "Обсуждение:",
-            "Участник:",
-            "Википедия:",
-            "Категория:",
-            "Портал:",
-            # Spanish
-            "Discusión:",
-            "Usuario:",
-            "Archivo:",
-            "Plantilla:",
-            "Ayuda:",
-            "Categoría:",
-            # Swedish
-            "Diskussion:",
-            "Användare:",
-            "Kategori",
-            "Fil:",
-            "Mall:",
-            "Hjälp:",
-        ]
-
-        # Remove namespaces before symbols as ":" is in the symbols.
-        wikipedia_namespaces += symbols_to_remove
-        for s in wikipedia_namespaces:
-            t = t.replace(s, "")
-
-        if language == "russian":
-            # Remove Latin characters that aren't in Cyrillic.
-            t = regex.sub(r"[+/p{Latin}]", "", t)
-
-        # Remove all spaces that are larger than one in length.
-        for i in range(
-            25, 0, -1
-        ):  # loop backwards to assure that smaller spaces aren't made
-            large_space = str(i * " ")
-            if large_space in t:
-                t = t.replace(large_space, " ")
-
-        if t not in ["", " "]:
-            cleaned_texts.append(t)
-
-    single_letter_words_dict = {
-        "french": ["a", "à", "y"],
-        "german": ["à"],
-        "italian": ["a", "e", "è", "i", "o"],
-        "portuguese": ["a", "e", "é", "o"],
-        "russian": ["а", "б", "в", "ж", "и", "к", "о", "с", "у", "я"],
-        "spanish": ["a", "e", "o", "u", "y"],
-        "swedish": ["à", "å", "i", "ö"],
-    }
-
-    return [
-        [
-            w
-            for w in text.split()
-            if (len(w) != 1 or w in single_letter_words_dict[language])
-            and w not in words_to_remove
-            and "nbsp" not in w
-            and "-" not in w
-            and "Wikipedia" not in w
-            and w != "-"
-        ]
-        for text in tqdm(
-            cleaned_texts, desc="Articles checked", unit="articles", disable=not verbose
-        )
-        if text != ""
-    ]
+    with Pool(
+        processes=os.cpu_count(),
+        initializer=_init_clean_worker,
+        initargs=(language, words_to_remove),
+    ) as pool:
+        for tokens in tqdm(
+            pool.imap(_clean_worker, texts, chunksize=100),
+            total=len(texts),
+            desc="Articles cleaned",
+            unit="articles",
+            disable=not verbose,
+        ):
+            if tokens is not None:
+                cleaned_texts.append(tokens)
+
+    return cleaned_texts
 
 
 def gen_autosuggestions(
@@ -362,7 +431,7 @@ def gen_autosuggestions(
     """
     counter_obj = Counter(chain.from_iterable(text_corpus))
 
-    top_words = [item[0] for item in counter_obj.most_common()][:num_words]
+    top_words = [item[0] for item in counter_obj.most_common(num_words)]
 
     if isinstance(ignore_words, str):
         words_to_ignore = [ignore_words]
@@ -402,19 +471,24 @@ def gen_autosuggestions(
             f"Queried {len(profanities)} words to be removed from autosuggest options."
         )
 
+    # Use frozensets for the per-candidate membership checks in the suggestion loop.
+    profanities = frozenset(profanities)
+    words_to_ignore = frozenset(words_to_ignore)
+
+    # Count the words that follow each top word in a single pass over the corpus
+    # rather than re-scanning the full corpus once per top word.
+    follower_counts = {w: Counter() for w in top_words}
+    for text in text_corpus:
+        for tup in zip(text, text[1:]):
+            if tup[0] in follower_counts:
+                follower_counts[tup[0]][tup[1]] += 1
+
     autosuggest_dict = {}
     for w in tqdm(
         top_words, desc="Autosuggestions generated", unit="word", disable=not verbose
     ):
-        words_after_w = [
-            [tup[1] for tup in zip(text, text[1:]) if w == tup[0]]
-            for text in text_corpus
-        ]
-
-        flat_words_after_w = [item for sublist in words_after_w for item in sublist]
-
         autosuggestions = []
-        for tup in Counter(flat_words_after_w).most_common():
+        for tup in follower_counts[w].most_common():
             if (
                 tup[0] != w
                 and tup[0].lower() not in w.lower()